@@ -38,20 +38,24 @@ app.use(express.urlencoded({ extended: false }));
 app.use((req, res, next) => {
   const start = Date.now();
   const path = req.path;
-  let capturedJsonResponse: Record<string, any> | undefined = undefined;
-
-  const originalResJson = res.json;
-  res.json = function (bodyJson, ...args) {
-    capturedJsonResponse = bodyJson;
-    return originalResJson.apply(res, [bodyJson, ...args]);
+  let capturedJsonBody: string | undefined = undefined;
+
+  // Capture JSON bodies as they are sent (res.json serializes before calling
+  // res.send) instead of stringifying large payloads a second time for the log line
+  const originalResSend = res.send;
+  res.send = function (body, ...args) {
+    if (typeof body === "string" && /json/.test(String(res.get("Content-Type")))) {
+      capturedJsonBody = body;
+    }
+    return originalResSend.apply(res, [body, ...args]);
   };
 
   res.on("finish", () => {
     const duration = Date.now() - start;
     if (path.startsWith("/api")) {
       let logLine = `${req.method} ${path} ${res.statusCode} in ${duration}ms`;
-      if (capturedJsonResponse) {
-        logLine += ` :: ${JSON.stringify(capturedJsonResponse)}`;
+      if (capturedJsonBody) {
+        logLine += ` :: ${capturedJsonBody.slice(0, 80)}`;
       }
 
       if (logLine.length > 80) {
@@ -2,13 +2,143 @@ import type { Express } from "express";
 import { createServer, type Server } from "http";
 import { WebSocketServer, WebSocket } from "ws";
 import { storage } from "./storage";
-import { insertTradeSchema, insertDepositSchema, insertWithdrawalSchema, updateSettingsSchema, type Trade } from "@shared/schema";
+import { insertTradeSchema, insertDepositSchema, insertWithdrawalSchema, updateSettingsSchema, type Trade, type Asset } from "@shared/schema";
 import { z } from "zod";
-import axios from "axios";
-import { MarketEngine, CandleSchema, PriceTickSchema } from "./market-engine";
-import { WebSocketHandler } from "./websocket-handler";
+import { randomBytes } from "crypto";
+
+// Extended timeframe support for OTC market (5s to 4h)
+const CANDLE_TIMEFRAME_SECONDS: Record<string, number> = {
+  '5s': 5,
+  '30s': 30,
+  '1m': 60,
+  '5m': 300,
+  '15m': 900,
+  '30m': 1800,
+  '1h': 3600,
+  '4h': 14400,
+};
+
+// Fallback base prices (used only if no DB data exists) - Only 4 best OTC assets
+const FALLBACK_BASE_PRICES: Record<string, number> = {
+  "EURUSD_OTC": 1.0856,
+  "GBPUSD_OTC": 1.2678,
+  "BTCUSD_OTC": 43256.50,
+  "GOLD_OTC": 2045.30
+};
+
+// Simulated Binomo trade ids: a random per-process prefix plus a counter, so
+// ids stay unique across restarts without drawing fresh randomness per trade
+const SIMULATED_TRADE_ID_PREFIX = `trade_${randomBytes(4).toString("hex")}`;
+let simulatedTradeCounter = 0;
+
+function nextSimulatedTradeId(): string {
+  return `${SIMULATED_TRADE_ID_PREFIX}_${(simulatedTradeCounter++).toString(16)}`;
+}
+
+// Short-lived in-process cache for polled Binomo responses. Entries are served
+// as-is for `ttlMs`, then kept until `staleTtlMs` as a fallback when reloading fails.
+// Concurrent misses for the same key share a single in-flight load.
+const BINOMO_CACHE_TTL_MS = 2000;
+const BINOMO_CACHE_STALE_TTL_MS = 60000;
+const BINOMO_CACHE_MAX_ENTRIES = 500;
+
+interface CachedResponse {
+  body: unknown;
+  freshUntil: number;
+  staleUntil: number;
+}
+const responseCache = new Map<string, CachedResponse>();
+const pendingLoads = new Map<string, Promise<unknown>>();
+
+async function getCachedResponse<T>(
+  key: string,
+  ttlMs: number,
+  staleTtlMs: number,
+  load: () => Promise<T>
+): Promise<T> {
+  const cached = responseCache.get(key);
+  if (cached && cached.freshUntil > Date.now()) {
+    return cached.body as T;
+  }
+
+  try {
+    let pending = pendingLoads.get(key) as Promise<T> | undefined;
+    if (!pending) {
+      pending = load()
+        .then(body => {
+          const now = Date.now();
+          responseCache.delete(key);
+          if (responseCache.size >= BINOMO_CACHE_MAX_ENTRIES) {
+            // Map keeps insertion order - drop the oldest entry
+            const oldestKey = responseCache.keys().next().value;
+            if (oldestKey !== undefined) responseCache.delete(oldestKey);
+          }
+          responseCache.set(key, { body, freshUntil: now + ttlMs, staleUntil: now + staleTtlMs });
+          return body;
+        })
+        .finally(() => pendingLoads.delete(key));
+      pendingLoads.set(key, pending);
+    }
+    return await pending;
+  } catch (error) {
+    if (cached && cached.staleUntil > Date.now()) {
+      console.error(`⚠️ Serving stale ${key} after load failure:`, error);
+      return cached.body as T;
+    }
+    throw error;
+  }
+}
+
+interface BinomoCandle {
+  timestamp: number;
+  open: number;
+  high: number;
+  low: number;
+  close: number;
+  volume: number;
+}
 
-const BINOMO_SERVICE_URL = process.env.BINOMO_SERVICE_URL || 'http://localhost:5001';
+// Columnar (one array per field) candle layout - avoids repeating every key per candle
+function toCandleColumns(candles: BinomoCandle[]) {
+  const length = candles.length;
+  const columns = {
+    t: new Array<number>(length),
+    o: new Array<number>(length),
+    h: new Array<number>(length),
+    l: new Array<number>(length),
+    c: new Array<number>(length),
+    v: new Array<number>(length),
+  };
+  for (let i = 0; i < length; i++) {
+    const candle = candles[i];
+    columns.t[i] = candle.timestamp;
+    columns.o[i] = candle.open;
+    columns.h[i] = candle.high;
+    columns.l[i] = candle.low;
+    columns.c[i] = candle.close;
+    columns.v[i] = candle.volume;
+  }
+  return columns;
+}
+
+// Round a price to a fixed number of decimals given as a power-of-ten scale.
+// Cheaper than parseFloat(value.toFixed(decimals)) in the candle generators.
+function roundToScale(value: number, scale: number): number {
+  return Math.round(value * scale) / scale;
+}
+
+// Dynamic volatility based on asset type (only 4 OTC assets)
+function getFallbackVolatility(id: string): number {
+  if (id.includes("BTC")) return 0.025;
+  if (id.includes("GOLD")) return 0.008;
+  return 0.0015; // Forex default (EURUSD, GBPUSD)
+}
+
+function getFallbackDecimals(id: string): number {
+  if (id.includes("BTC")) return 2;
+  if (id.includes("GOLD")) return 2;
+  return 5; // Forex default (EURUSD, GBPUSD)
+}
 
 export async function registerRoutes(app: Express): Promise<Server> {
   const httpServer = createServer(app);
@@ -59,6 +189,28 @@ export async function registerRoutes(app: Express): Promise<Server> {
   // Load open trades immediately
   await loadOpenTrades();
 
+  // Asset list cache - refreshed in the background once per price tick so the
+  // asset endpoints and per-second loops read it without a DB query each time
+  const ASSETS_REFRESH_MS = 1000;
+  let cachedAssets: Asset[] | null = null;
+
+  const refreshCachedAssets = async () => {
+    try {
+      cachedAssets = await storage.getAllAssets();
+    } catch (error) {
+      console.error('Error refreshing assets cache:', error);
+    }
+  };
+
+  const getCachedAssets = async (): Promise<Asset[]> => {
+    if (!cachedAssets) {
+      cachedAssets = await storage.getAllAssets();
+    }
+    return cachedAssets;
+  };
+
+  setInterval(refreshCachedAssets, ASSETS_REFRESH_MS);
+
   // Binomo API endpoints - Direct implementation (no external service needed)
   const AUTHTOKEN = process.env.BINOMO_AUTHTOKEN || '';
   const DEVICE_ID = process.env.BINOMO_DEVICE_ID || '';
@@ -81,16 +233,19 @@ export async function registerRoutes(app: Express): Promise<Server> {
     });
   });
 
-  app.get("/api/binomo/health", async (req, res) => {
-    res.json({
-      status: "ok",
-      connected: HAS_CREDS,
-      service: "binomo-api",
-      has_credentials: HAS_CREDS,
-      auth_token_present: Boolean(AUTHTOKEN),
-      device_id_present: Boolean(DEVICE_ID),
-      mode: HAS_CREDS ? "configured" : "simulated"
-    });
+  // Credentials are read once at startup, so the health payload is serialized once too
+  const binomoHealthBody = JSON.stringify({
+    status: "ok",
+    connected: HAS_CREDS,
+    service: "binomo-api",
+    has_credentials: HAS_CREDS,
+    auth_token_present: Boolean(AUTHTOKEN),
+    device_id_present: Boolean(DEVICE_ID),
+    mode: HAS_CREDS ? "configured" : "simulated"
+  });
+
+  app.get("/api/binomo/health", (req, res) => {
+    res.type("json").send(binomoHealthBody);
   });
 
   app.get("/api/binomo/balance", async (req, res) => {
@@ -103,16 +258,6 @@ export async function registerRoutes(app: Express): Promise<Server> {
     });
   });
 
-  app.get("/api/binomo/assets", async (req, res) => {
-    // Return OTC assets from storage
-    try {
-      const assets = await storage.getAllAssets();
-      res.json(assets);
-    } catch (error) {
-      res.status(500).json({ message: "Failed to fetch OTC assets" });
-    }
-  });
-
   app.get("/api/price-data/:assetId", async (req, res) => {
     try {
       const { assetId } = req.params;
@@ -136,95 +281,85 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
 
+  // Load candles for the Binomo chart: DB first, generated fallback otherwise
+  const loadBinomoCandles = async (assetId: string, timeframe: string | undefined, count: number): Promise<BinomoCandle[]> => {
+    // ✅ CRITICAL FIX: Load candles from DB instead of generating random ones
+    const dbCandles = await storage.getPriceData(assetId, count);
+    
+    if (dbCandles && dbCandles.length >= count) {
+      // ✅ Return saved candles from database (preserve chart shape)
+      const candles = dbCandles.map(pd => ({
+        timestamp: Math.floor(new Date(pd.timestamp).getTime() / 1000),
+        open: parseFloat(pd.open),
+        high: parseFloat(pd.high),
+        low: parseFloat(pd.low),
+        close: parseFloat(pd.close),
+        volume: 0
+      })).reverse(); // Reverse: oldest to newest
+      
+      console.log(`✅ Loaded ${candles.length} candles from DB for ${assetId}`);
+      return candles;
+    }
+    
+    // Only generate if no data exists (first time only)
+    console.log(`⚠️ No DB candles for ${assetId}, generating initial data...`);
+    
+    const intervalSeconds = CANDLE_TIMEFRAME_SECONDS[timeframe || '1m'] || 60;
+    
+    let basePrice = FALLBACK_BASE_PRICES[assetId] || 1.0;
+    const currentTime = Math.floor(Date.now() / 1000);
+    const candles = new Array<BinomoCandle>(count);
+    
+    const volatility = getFallbackVolatility(assetId);
+    const scale = 10 ** getFallbackDecimals(assetId);
+    
+    for (let i = 0; i < count; i++) {
+      const span = volatility * basePrice;
+      const priceChange = (Math.random() - 0.5) * span;
+      const openPrice = basePrice + priceChange;
+      
+      // More realistic high/low generation
+      const highChange = Math.random() * span * 0.7;
+      const lowChange = Math.random() * span * 0.7;
+      const closeChange = (Math.random() - 0.5) * span * 0.8;
+      const closePrice = openPrice + closeChange;
+      const close = roundToScale(closePrice, scale);
+      
+      // Fill the preallocated slot and carry the close forward as a local
+      candles[i] = {
+        timestamp: currentTime - (count - i) * intervalSeconds,
+        open: roundToScale(openPrice, scale),
+        high: roundToScale(Math.max(openPrice, closePrice) + highChange, scale),
+        low: roundToScale(Math.min(openPrice, closePrice) - lowChange, scale),
+        close,
+        volume: Math.floor(Math.random() * 150000) + 5000
+      };
+      
+      basePrice = close;
+    }
+    
+    return candles;
+  };
+
   app.get("/api/binomo/candles/:assetId/:timeframe?", async (req, res) => {
     const { assetId, timeframe } = req.params;
     const count = parseInt(req.query.count as string) || 100;
+    // ?format=columns returns one array per field instead of one object per candle
+    const columnar = req.query.format === 'columns';
     
     try {
-      // ✅ CRITICAL FIX: Load candles from DB instead of generating random ones
-      const dbCandles = await storage.getPriceData(assetId, count);
-      
-      if (dbCandles && dbCandles.length >= count) {
-        // ✅ Return saved candles from database (preserve chart shape)
-        const candles = dbCandles.map(pd => ({
-          timestamp: Math.floor(new Date(pd.timestamp).getTime() / 1000),
-          open: parseFloat(pd.open),
-          high: parseFloat(pd.high),
-          low: parseFloat(pd.low),
-          close: parseFloat(pd.close),
-          volume: 0
-        })).reverse(); // Reverse: oldest to newest
-        
-        console.log(`✅ Loaded ${candles.length} candles from DB for ${assetId}`);
-        return res.json(candles);
-      }
-      
-      // Only generate if no data exists (first time only)
-      console.log(`⚠️ No DB candles for ${assetId}, generating initial data...`);
-      
-      // Extended timeframe support for OTC market (5s to 4h)
-      const timeframeSeconds: Record<string, number> = {
-        '5s': 5,
-        '30s': 30,
-        '1m': 60,
-        '5m': 300,
-        '15m': 900,
-        '30m': 1800,
-        '1h': 3600,
-        '4h': 14400,
-      };
-      const intervalSeconds = timeframeSeconds[timeframe || '1m'] || 60;
-      
-      // Fallback base prices (used only if no DB data exists) - Only 4 best OTC assets
-      const fallbackPrices: Record<string, number> = {
-        "EURUSD_OTC": 1.0856,
-        "GBPUSD_OTC": 1.2678,
-        "BTCUSD_OTC": 43256.50,
-        "GOLD_OTC": 2045.30
-      };
-      
-      let basePrice = fallbackPrices[assetId] || 1.0;
-      const currentTime = Math.floor(Date.now() / 1000);
-      const candles = [];
-      
-      // Dynamic volatility based on asset type (only 4 OTC assets)
-      const getVolatility = (id: string): number => {
-        if (id.includes("BTC")) return 0.025;
-        if (id.includes("GOLD")) return 0.008;
-        return 0.0015; // Forex default (EURUSD, GBPUSD)
-      };
-      
-      const getDecimals = (id: string): number => {
-        if (id.includes("BTC")) return 2;
-        if (id.includes("GOLD")) return 2;
-        return 5; // Forex default (EURUSD, GBPUSD)
-      };
-      
-      const volatility = getVolatility(assetId);
-      const decimals = getDecimals(assetId);
-      
-      for (let i = 0; i < count; i++) {
-        const priceChange = (Math.random() - 0.5) * volatility * basePrice;
-        const openPrice = basePrice + priceChange;
-        
-        // More realistic high/low generation
-        const highChange = Math.random() * volatility * basePrice * 0.7;
-        const lowChange = Math.random() * volatility * basePrice * 0.7;
-        const closeChange = (Math.random() - 0.5) * volatility * basePrice * 0.8;
-        
-        candles.push({
-          timestamp: currentTime - (count - i) * intervalSeconds,
-          open: parseFloat(openPrice.toFixed(decimals)),
-          high: parseFloat((Math.max(openPrice, openPrice + closeChange) + highChange).toFixed(decimals)),
-          low: parseFloat((Math.min(openPrice, openPrice + closeChange) - lowChange).toFixed(decimals)),
-          close: parseFloat((openPrice + closeChange).toFixed(decimals)),
-          volume: Math.floor(Math.random() * 150000) + 5000
-        });
-        
-        basePrice = candles[candles.length - 1].close;
-      }
-      
-      res.json(candles);
+      // The chart polls every few seconds - serve repeated requests from the short-lived
+      // cache, which holds the serialized body so cache hits skip JSON.stringify as well
+      const body = await getCachedResponse(
+        `candles:${assetId}:${timeframe || '1m'}:${count}:${columnar ? 'columns' : 'rows'}`,
+        BINOMO_CACHE_TTL_MS,
+        BINOMO_CACHE_STALE_TTL_MS,
+        async () => {
+          const candles = await loadBinomoCandles(assetId, timeframe, count);
+          return JSON.stringify(columnar ? toCandleColumns(candles) : candles);
+        }
+      );
+      res.type("json").send(body);
     } catch (error) {
       console.error(`❌ Error loading candles for ${assetId}:`, error);
       res.status(500).json({ message: "Failed to load candles" });
@@ -233,7 +368,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
   app.post("/api/binomo/trade", async (req, res) => {
     const { asset_id, amount, direction, duration } = req.body;
-    const tradeId = `trade_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+    const tradeId = nextSimulatedTradeId();
     
     // Simulate trade execution
     res.json({
@@ -286,10 +421,10 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
 
-  // Get all assets
-  app.get("/api/assets", async (req, res) => {
+  // Get all assets (the Binomo page reads the same OTC asset list)
+  app.get(["/api/assets", "/api/binomo/assets"], async (req, res) => {
     try {
-      const assets = await storage.getAllAssets();
+      const assets = await getCachedAssets();
       res.json(assets);
     } catch (error) {
       res.status(500).json({ message: "Failed to fetch assets" });
@@ -799,7 +934,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
         const data = JSON.parse(message.toString());
         if (data.type === 'subscribe') {
           // Send initial asset data
-          storage.getAllAssets().then(assets => {
+          getCachedAssets().then(assets => {
             if (ws.readyState === WebSocket.OPEN) {
               ws.send(JSON.stringify({
                 type: 'assets',
@@ -1171,6 +1306,9 @@ export async function registerRoutes(app: Express): Promise<Server> {
       trendVolatility = 0.0008;
     }
     
+    // Determine decimals (as a rounding scale) once - the asset type does not change per candle
+    const scale = 10 ** (assetId.includes('BTC') || assetId.includes('GOLD') ? 2 : 5);
+    
     // 🎯 PERSISTENT TREND: Generate 3-5 trend periods to create realistic chart
     const trendPeriods = 3 + Math.floor(Math.random() * 3); // 3-5 periods
     const candlesPerPeriod = Math.floor(count / trendPeriods);
@@ -1217,17 +1355,13 @@ export async function registerRoutes(app: Express): Promise<Server> {
         const high = Math.max(open, close) + upperWickSize * (0.3 + Math.random() * 0.7);
         const low = Math.min(open, close) - lowerWickSize * (0.3 + Math.random() * 0.7);
         
-        // Determine decimals
-        let decimals = 5; // Default for Forex
-        if (assetId.includes('BTC') || assetId.includes('GOLD')) decimals = 2;
-        
         candles.push({
           assetId,
           timestamp,
-          open: parseFloat(open.toFixed(decimals)).toString(),
-          high: parseFloat(high.toFixed(decimals)).toString(),
-          low: parseFloat(low.toFixed(decimals)).toString(),
-          close: parseFloat(close.toFixed(decimals)).toString(),
+          open: roundToScale(open, scale).toString(),
+          high: roundToScale(high, scale).toString(),
+          low: roundToScale(low, scale).toString(),
+          close: roundToScale(close, scale).toString(),
           volume: (50000 + Math.random() * 100000).toString()
         });
         
@@ -1434,7 +1568,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
   // Send price updates every second (client builds candles based on their interval)
   setInterval(async () => {
-    const assets = await storage.getAllAssets();
+    const assets = await getCachedAssets();
     
     assets.forEach(asset => {
       const pair = asset.id.replace('_OTC', '');
@@ -1477,7 +1611,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
   // Save and update candles to database every 5 seconds
   setInterval(async () => {
-    const assets = await storage.getAllAssets();
+    const assets = await getCachedAssets();
     const currentTime = Math.floor(Date.now() / 1000);
     
     for (const asset of assets) {
@@ -2,7 +2,7 @@ import { type User, type InsertUser, type Asset, type InsertAsset, type Trade, t
 import { randomUUID } from "crypto";
 import { drizzle } from 'drizzle-orm/node-postgres';
 import { Pool } from 'pg';
-import { eq, desc, and } from 'drizzle-orm';
+import { eq, desc, and, gte, lt } from 'drizzle-orm';
 
 export interface IStorage {
   // Users
@@ -60,9 +60,13 @@ export class DbStorage implements IStorage {
       throw new Error("DATABASE_URL is not set");
     }
     
+    // Keep pooled sockets alive so the 1-second market loops reuse connections
+    // instead of paying a new TCP + TLS handshake after every idle period
     const pool = new Pool({
       connectionString: process.env.DATABASE_URL,
-      ssl: { rejectUnauthorized: false }
+      ssl: { rejectUnauthorized: false },
+      keepAlive: true,
+      idleTimeoutMillis: 60000,
     });
     this.db = drizzle(pool);
     this.initialize();
@@ -221,7 +225,6 @@ export class DbStorage implements IStorage {
   }
 
   async getPriceDataSince(assetId: string, sinceTimestamp: Date): Promise<PriceData[]> {
-    const { gte } = await import('drizzle-orm');
     return await this.db.select().from(priceDataTable)
       .where(and(
         eq(priceDataTable.assetId, assetId),
@@ -252,7 +255,6 @@ export class DbStorage implements IStorage {
   }
 
   async cleanupOldPriceData(daysToKeep: number): Promise<number> {
-    const { lt } = await import('drizzle-orm');
     const cutoffDate = new Date();
     cutoffDate.setDate(cutoffDate.getDate() - daysToKeep);
     